@@ -65,6 +65,7 @@ class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "super-secret-key")
     PORT = _env_int("PORT", 5000)
     DEBUG = _env_bool("FLASK_DEBUG", False)
+    SERVER_THREADS = max(1, _env_int("SERVER_THREADS", 8))  # Threads du worker gunicorn (run.py)
 
     # ================ Logging Settings ================
     LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "INFO").upper()
@@ -16,6 +16,15 @@ _REPLICA_STATUS_MESSAGES: dict[BootstrapState, str] = {
     "error": "Local embedded replica failed to initialize.",
     "unknown": "Replica state is unknown.",
 }
+# PRAGMAs appliqués à chaque connexion de lecture sur la réplica locale.
+# L'application ne fait que des SELECT : on agrandit le cache de pages, on garde
+# les tables temporaires (ORDER BY / GROUP BY) en mémoire et on lit via mmap.
+_READ_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA query_only = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",  # 64 MiB (valeur négative = KiB)
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+)
 log = logging.getLogger(__name__)
 _last_reported_state: BootstrapState | None = None
 
@@ -38,6 +47,12 @@ def get_replica_status() -> dict[str, str | None]:
     }
 
 
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Appliquer les PRAGMAs de lecture à une connexion sur la réplica locale."""
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+
+
 def get_local_db() -> sqlite3.Connection:
     if not is_replica_ready():
         replica_status = get_replica_status()
@@ -53,6 +68,7 @@ def get_local_db() -> sqlite3.Connection:
         log.debug("Opening SQLite connection to local replica at %s.", current_app.config["LOCAL_DB_PATH"])
         conn = sqlite3.connect(current_app.config["LOCAL_DB_PATH"])
         conn.row_factory = sqlite3.Row
+        _configure_connection(conn)
         g.db = conn
 
     return cast(sqlite3.Connection, g.db)
@@ -6,6 +6,7 @@ from typing import Any
 
 from app.db.connections import get_local_db
 from app.services.geocoding import (
+    get_continent_code_by_country_code,
     get_continent_code_by_name,
     get_continent_name_by_code,
     get_continent_names_by_iso,
@@ -48,8 +49,7 @@ def _continent_code_for_country_code(country_code: str) -> str:
     normalized_country_code = _clean_str(country_code).upper()
     if not normalized_country_code:
         return ""
-    continent_name = get_continent_names_by_iso().get(normalized_country_code, "")
-    return (get_continent_code_by_name(continent_name) or "").upper()
+    return get_continent_code_by_country_code(normalized_country_code) or ""
 
 
 @lru_cache(maxsize=16) # Cache rajouté par l'IA
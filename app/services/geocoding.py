@@ -11,6 +11,7 @@ ISO_3166_CSV = Path(__file__).resolve().parent.parent / Config.DATA_DIR / "iso31
 # Faite par l'IA: assure la cohérence du dictionnaire chargé à partir du CSV.
 class _GeoLookup(TypedDict):
     continent_by_iso: dict[str, str]
+    continent_code_by_iso: dict[str, str]
     continent_name_by_code: dict[str, str]
     continent_code_by_name: dict[str, str]
     country_name_by_code: dict[str, str]
@@ -39,6 +40,7 @@ def _load_geo_lookup() -> _GeoLookup:
         raise FileNotFoundError(f"ISO-3166 CSV not found: {path}")
 
     continent_by_iso_code: dict[str, str] = {}
+    continent_code_by_iso_code: dict[str, str] = {}
     continent_name_by_code: dict[str, str] = {}
     continent_code_by_name: dict[str, str] = {}
     country_name_by_code: dict[str, str] = {}
@@ -46,21 +48,38 @@ def _load_geo_lookup() -> _GeoLookup:
     country_code_by_name: dict[str, str] = {}
 
     with path.open(encoding="utf-8", newline="") as f:
-        for row in csv.DictReader(f):
-            code_a2 = row.get("Two_Letter_Country_Code", "").strip().upper()
-            code_a3 = row.get("Three_Letter_Country_Code", "").strip().upper()
-            continent = row.get("Continent_Name", "").strip()
-            continent_code = row.get("Continent_Code", "").strip().upper()
-            country_name = row.get("Country_Name", "").strip()
+        reader = csv.reader(f)
+        # Résoudre les index des colonnes une seule fois, puis lire chaque ligne par position.
+        columns = {name: index for index, name in enumerate(next(reader, []))}
+        i_code_a2 = columns.get("Two_Letter_Country_Code", -1)
+        i_code_a3 = columns.get("Three_Letter_Country_Code", -1)
+        i_continent = columns.get("Continent_Name", -1)
+        i_continent_code = columns.get("Continent_Code", -1)
+        i_country_name = columns.get("Country_Name", -1)
+        indexes = (i_code_a2, i_code_a3, i_continent, i_continent_code, i_country_name)
+        # Colonne manquante : aucune ligne exploitable, comme avec DictReader.
+        rows = reader if min(indexes) >= 0 else ()
+        row_width = max(indexes) + 1
+
+        for row in rows:
+            if len(row) < row_width:
+                continue
+            code_a2 = row[i_code_a2].strip().upper()
+            code_a3 = row[i_code_a3].strip().upper()
+            continent = row[i_continent].strip()
+            continent_code = row[i_continent_code].strip().upper()
+            country_name = row[i_country_name].strip()
             if not (continent and continent_code and code_a2 and country_name):
                 continue
 
             # Les mettre dans les dictionnaires
             continent_by_iso_code[code_a2] = continent
+            continent_code_by_iso_code[code_a2] = continent_code
             country_name_by_code[code_a2] = country_name
             country_code_a2_by_code[code_a2] = code_a2
             if code_a3:
                 continent_by_iso_code[code_a3] = continent
+                continent_code_by_iso_code[code_a3] = continent_code
                 country_name_by_code[code_a3] = country_name
                 country_code_a2_by_code[code_a3] = code_a2
 
@@ -82,6 +101,7 @@ def _load_geo_lookup() -> _GeoLookup:
 
     return {
         "continent_by_iso": continent_by_iso_code,
+        "continent_code_by_iso": continent_code_by_iso_code,
         "continent_name_by_code": continent_name_by_code,
         "continent_code_by_name": continent_code_by_name,
         "country_name_by_code": country_name_by_code,
@@ -105,6 +125,20 @@ def get_continent_names_by_iso() -> dict[str, str]:
     return dict(_get_geo_lookup()["continent_by_iso"])
 
 
+def get_continent_name_by_country_code(code: str) -> str | None:
+    """Fonction utilitaire pour obtenir le nom de continent à partir d'un code de pays (A2 ou A3), sans copier tout le dictionnaire."""
+    if not code:
+        return None
+    return _get_geo_lookup()["continent_by_iso"].get(code.strip().upper())
+
+
+def get_continent_code_by_country_code(code: str) -> str | None:
+    """Fonction utilitaire pour obtenir le code de continent à partir d'un code de pays (A2 ou A3), en une seule recherche."""
+    if not code:
+        return None
+    return _get_geo_lookup()["continent_code_by_iso"].get(code.strip().upper())
+
+
 def get_country_name_by_code(code: str) -> str | None:
     """Fonction utilitaire pour obtenir le nom de pays à partir d'un code de pays (A2 ou A3)."""
     if not code:
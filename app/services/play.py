@@ -3,14 +3,15 @@ from __future__ import annotations
 import random
 import re
 from functools import lru_cache
-from math import asin, cos, pow, radians, sin, sqrt
+from itertools import accumulate
+from math import asin, cos, exp, log, radians, sin, sqrt
 from typing import Any
 
 from app.db.connections import get_local_db
 from app.services.geocoding import (
-    get_continent_code_by_name,
+    get_continent_code_by_country_code,
     get_continent_name_by_code,
-    get_continent_names_by_iso,
+    get_continent_name_by_country_code,
     get_country_name_by_code,
 )
 
@@ -20,6 +21,9 @@ COUNTRY_SCOPE = "country"
 MAX_ROUND_SCORE = 5000
 WORLD_PERFECT_DISTANCE_METERS = 150.0
 ROUNDING_TARGET_RATIO = (MAX_ROUND_SCORE - 0.5) / MAX_ROUND_SCORE
+# ratio ** (mètres / 150) == exp(km * _SCORE_DECAY_PER_KM) : log et division calculés une seule fois.
+_SCORE_DECAY_PER_KM = log(ROUNDING_TARGET_RATIO) * 1000.0 / WORLD_PERFECT_DISTANCE_METERS
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _clean_str(value: Any) -> str:
@@ -29,6 +33,21 @@ def _clean_str(value: Any) -> str:
     return "" if value is None else str(value).strip()
 
 
+def _norm_code(value: Any) -> str:
+    """
+    Fonction utilitaire pour normaliser un code pays/continent (strip + majuscules) en une seule passe.
+    """
+    return "" if value is None else str(value).strip().upper()
+
+
+@lru_cache(maxsize=2048)
+def _genus_regex(genus: str) -> re.Pattern[str]:
+    """
+    Compiler (une seule fois par genre) le motif qui retire "(Genre)" d'un nom vernaculaire.
+    """
+    return re.compile(rf"\(\s*{re.escape(genus)}\s*\)", re.IGNORECASE)
+
+
 def _format_vernacular_name(raw_name: str, scientific_name: str) -> str:
     """
     Mettre le nom vernacular en title case, enlever le nom de genre entre parenthèses s'il est présent.
@@ -40,10 +59,9 @@ def _format_vernacular_name(raw_name: str, scientific_name: str) -> str:
 
     genus = _clean_str(scientific_name).split(" ")[0]
     if genus:
-        genus_pattern = re.compile(rf"\(\s*{re.escape(genus)}\s*\)", re.IGNORECASE)
-        vernacular = genus_pattern.sub("", vernacular)
+        vernacular = _genus_regex(genus).sub("", vernacular)
 
-    vernacular = re.sub(r"\s+", " ", vernacular).strip(" -_,.;:")
+    vernacular = _WHITESPACE_RE.sub(" ", vernacular).strip(" -_,.;:")
     return vernacular.title()
 
 
@@ -52,38 +70,33 @@ def _get_available_world_continent_codes() -> list[str]:
     """
     Récupérer la liste des codes de continent disponibles dans la base de données.
     """
-    continent_names_by_iso = get_continent_names_by_iso()
-    
-    # Get existing country codes from the species_country_stats table
-    existing_country_codes = get_local_db().execute(
+    # Normaliser et dédupliquer les codes pays côté SQLite, puis une seule recherche par code.
+    rows = get_local_db().execute(
         """
-        SELECT DISTINCT country_code
+        SELECT DISTINCT UPPER(TRIM(country_code))
         FROM species_country_stats
         WHERE country_code IS NOT NULL
         """
-    ).fetchall()
-            
-    return list(set(
+    )
+    return list({
         continent_code
-        for row in existing_country_codes
-        if (country_code := _clean_str(row["country_code"]))
-        and (continent_code := get_continent_code_by_name(continent_names_by_iso.get(country_code.upper(), "")))
-    ))
+        for (country_code,) in rows
+        if country_code and (continent_code := get_continent_code_by_country_code(country_code))
+    })
 
 
 def parse_play_scope(args: Any) -> dict[str, str]:
     """
     Analyser les paramètres de portée pour déterminer le type de portée et les codes associés.
     """
-    country_code = _clean_str(args.get("country_code")).upper()
-    continent_code = _clean_str(args.get("continent_code")).upper()
+    country_code = _norm_code(args.get("country_code"))
+    continent_code = _norm_code(args.get("continent_code"))
 
     if country_code:
         normalized_country_name = get_country_name_by_code(country_code)
         if normalized_country_name:
-            continent_names_by_iso = get_continent_names_by_iso()
-            continent_name = continent_names_by_iso.get(country_code, "")
-            continent_code = _clean_str(get_continent_code_by_name(continent_name)).upper()
+            continent_name = get_continent_name_by_country_code(country_code) or ""
+            continent_code = get_continent_code_by_country_code(country_code) or ""
             return {
                 "scope_type": COUNTRY_SCOPE,
                 "country_code": country_code,
@@ -125,6 +138,16 @@ def _build_world_weights(continent_codes: list[str], antarctica_probability: flo
     return [p_an if code == "AN" else p_other for code in continent_codes]
 
 
+@lru_cache(maxsize=16)
+def _get_world_round_pool(antarctica_probability: float) -> tuple[tuple[str, ...], list[float]]:
+    """
+    Mettre en cache les codes de continent disponibles et leurs poids cumulés pour le tirage des rounds "world".
+    """
+    continent_codes = tuple(_get_available_world_continent_codes())
+    weights = _build_world_weights(list(continent_codes), antarctica_probability)
+    return continent_codes, list(accumulate(weights))
+
+
 def build_round_plan(
     scope: dict[str, str],
     total_rounds: int,
@@ -137,12 +160,15 @@ def build_round_plan(
     scope_type = scope.get("scope_type") or WORLD_SCOPE
 
     if scope_type == WORLD_SCOPE:
-        continent_codes = _get_available_world_continent_codes()
+        continent_codes, cum_weights = _get_world_round_pool(float(world_antarctica_probability))
         if not continent_codes:
             return []
 
-        weights = _build_world_weights(continent_codes, world_antarctica_probability)
-        selected_codes = random.choices(continent_codes, weights=weights, k=round_count)
+        selected_codes = random.choices(continent_codes, cum_weights=cum_weights, k=round_count)
+        # Une seule résolution de nom par continent distinct, pas une par round.
+        continent_names = {
+            code: get_continent_name_by_code(code) or code for code in set(selected_codes)
+        }
         return [
             {
                 "round_index": index,
@@ -150,7 +176,7 @@ def build_round_plan(
                 "country_code": "",
                 "country": "",
                 "continent_code": continent_code,
-                "continent": get_continent_name_by_code(continent_code) or continent_code,
+                "continent": continent_names[continent_code],
             }
             for index, continent_code in enumerate(selected_codes)
         ]
@@ -248,8 +274,8 @@ def get_scope_scale_meters(scope: dict[str, Any]) -> float:
     """
     Récupérer l'échelle (en mètres) d'un scope.
     """
-    country_code = _clean_str(scope.get("country_code")).upper()
-    continent_code = _clean_str(scope.get("continent_code")).upper()
+    country_code = _norm_code(scope.get("country_code"))
+    continent_code = _norm_code(scope.get("continent_code"))
     return _get_scope_scale_meters_cached(country_code, continent_code)
 
 
@@ -260,10 +286,7 @@ def compute_geoguessr_score(distance_km: float, scale_meters: float) -> int:
     L'échelle est ignorée dans l'exposant : seule la distance compte.
     """
     safe_distance_km = max(0.0, float(distance_km))
-    raw_score = MAX_ROUND_SCORE * pow(
-        ROUNDING_TARGET_RATIO,
-        (safe_distance_km * 1000) / WORLD_PERFECT_DISTANCE_METERS,
-    )
+    raw_score = MAX_ROUND_SCORE * exp(safe_distance_km * _SCORE_DECAY_PER_KM)
     return int(raw_score + 0.5)
 
 
@@ -274,8 +297,8 @@ def select_random_round_image(round_scope: dict[str, Any]) -> dict[str, Any] | N
     ]
     params: list[Any] = []
 
-    country_code = _clean_str(round_scope.get("country_code")).upper()
-    continent_code = _clean_str(round_scope.get("continent_code")).upper()
+    country_code = _norm_code(round_scope.get("country_code"))
+    continent_code = _norm_code(round_scope.get("continent_code"))
     if country_code:
         conditions.append("UPPER(o.country_code) = ?")
         params.append(country_code)
@@ -291,45 +314,58 @@ def select_random_round_image(round_scope: dict[str, Any]) -> dict[str, Any] | N
 
     pivot_rowid = random.randint(1, max_rowid)
 
-    def _pick_row(rowid_operator: str) -> Any:
-        return conn.execute(
-            f"""
-            SELECT
-                o.gbifID AS gbif_id,
-                o.species AS species,
-                s.scientific_name AS scientific_name,
-                s.common_name_en AS vernacular_name,
-                o.latitude AS latitude,
-                o.longitude AS longitude,
-                UPPER(o.country_code) AS country_code,
-                o.country AS country,
-                UPPER(o.continent_code) AS continent_code,
-                o.continent AS continent,
-                (
-                    SELECT i.url
-                    FROM images i
-                    WHERE i.gbifID = o.gbifID
-                    ORDER BY i.rowid DESC
-                    LIMIT 1
-                ) AS image_url
-            FROM occurrences o
-            LEFT JOIN species s ON s.species = o.species
-            WHERE {" AND ".join(conditions)}
-              AND o.rowid {rowid_operator} ?
-            ORDER BY o.rowid
-            LIMIT 1
-            """,
-            [*params, pivot_rowid],
-        ).fetchone()
+    where_sql = " AND ".join(conditions)
+
+    def _candidate_sql(rowid_operator: str) -> str:
+        return f"""
+            SELECT * FROM (
+                SELECT
+                    o.gbifID AS gbif_id,
+                    o.species AS species,
+                    s.scientific_name AS scientific_name,
+                    s.common_name_en AS vernacular_name,
+                    o.latitude AS latitude,
+                    o.longitude AS longitude,
+                    UPPER(o.country_code) AS country_code,
+                    o.country AS country,
+                    UPPER(o.continent_code) AS continent_code,
+                    o.continent AS continent
+                FROM occurrences o
+                LEFT JOIN species s ON s.species = o.species
+                WHERE {where_sql}
+                  AND o.rowid {rowid_operator} ?
+                ORDER BY o.rowid
+                LIMIT 1
+            )
+        """
 
-    row = _pick_row(">=")
-    if not row:
-        row = _pick_row("<")
+    # Une seule requête : la première ligne à partir du pivot, sinon on repart du début
+    # de la table. Le LIMIT 1 sur l'UNION ALL évite d'exécuter la 2e branche si la 1re suffit.
+    row = conn.execute(
+        f"""
+        SELECT
+            picked.*,
+            (
+                SELECT i.url
+                FROM images i
+                WHERE i.gbifID = picked.gbif_id
+                ORDER BY i.rowid DESC
+                LIMIT 1
+            ) AS image_url
+        FROM (
+            {_candidate_sql(">=")}
+            UNION ALL
+            {_candidate_sql("<")}
+            LIMIT 1
+        ) AS picked
+        """,
+        [*params, pivot_rowid, *params, pivot_rowid],
+    ).fetchone()
     if not row:
         return None
 
-    country_code = _clean_str(row["country_code"]).upper()
-    continent_code = _clean_str(row["continent_code"]).upper()
+    country_code = _norm_code(row["country_code"])
+    continent_code = _norm_code(row["continent_code"])
     country_name = _clean_str(row["country"]) or _clean_str(get_country_name_by_code(country_code))
     continent_name = _clean_str(row["continent"]) or _clean_str(
         get_continent_name_by_code(continent_code)
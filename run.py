@@ -1,11 +1,52 @@
 from app import create_app
 from app.config import ProductionConfig, TestConfig
 
+
+def _serve_with_gunicorn(config_class) -> bool:
+    """
+    Lancer l'application derrière gunicorn si disponible (Linux / macOS).
+    Retourne False si gunicorn n'est pas installé (ex. Windows), pour revenir au serveur Flask.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication # type: ignore
+    except ModuleNotFoundError:
+        return False
+
+    class _HerbaTerraApplication(BaseApplication):
+        def __init__(self, options: dict[str, object]):
+            self.options = options
+            super().__init__()
+
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            # L'application est créée dans le worker (et non avant le fork) pour que le thread
+            # de bootstrap de la réplica tourne dans le même processus que les requêtes.
+            return create_app(config_class)
+
+    _HerbaTerraApplication(
+        {
+            "bind": f"0.0.0.0:{config_class.PORT}",
+            # Un seul processus : l'état du bootstrap est global au processus, et un seul
+            # processus doit synchroniser le fichier de la réplica. La concurrence passe par les threads.
+            "workers": 1,
+            "worker_class": "gthread",
+            "threads": config_class.SERVER_THREADS,
+        }
+    ).run()
+    return True
+
+
 if __name__ == "__main__":
-    app = create_app(ProductionConfig)
-    app.run(                            # Lancer le serveur Flask
-        host="0.0.0.0",
-        port=app.config.get("PORT", 5000),
-        debug=app.config.get("DEBUG", False),   # Mettre à True pour voir les logs plus précis
-        use_reloader=app.config.get("DEBUG", False),    # Utiliser pendant la phase de développement pour reloader automatiquement quand il y a des modifications
-    )
\ No newline at end of file
+    config_class = ProductionConfig
+    if config_class.DEBUG or not _serve_with_gunicorn(config_class):
+        app = create_app(config_class)
+        app.run(                            # Lancer le serveur Flask (développement, ou si gunicorn est absent)
+            host="0.0.0.0",
+            port=app.config.get("PORT", 5000),
+            debug=app.config.get("DEBUG", False),   # Mettre à True pour voir les logs plus précis
+            use_reloader=app.config.get("DEBUG", False),    # Utiliser pendant la phase de développement pour reloader automatiquement quand il y a des modifications
+            threaded=True,
+        )